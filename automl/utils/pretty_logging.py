@@ -3,18 +3,32 @@
 from __future__ import annotations
 
 import logging
+import logging.handlers
 import os
 import platform
+import queue
 import re
 import sys
+import threading
+import time
 import warnings
+import weakref
+from itertools import chain
 from pathlib import Path
+from typing import Final
 
 import colorama
 
 LOGGING_NAME = "automl"
 SUCCESS = 25
 WINDOWS = platform.system() == "Windows"
+# Whether stdout can render emojis (resolved once; UTF encodings cover every codepoint)
+_STDOUT_ENCODING = (getattr(sys.stdout, "encoding", None) or "utf-8").lower()
+_STDOUT_UTF8 = _STDOUT_ENCODING.replace("-", "").replace("_", "") in {
+    "utf8",
+    "utf16",
+    "utf32",
+}
 
 # -----------------------------------------------------------------------------
 # Logging configuration parameters (read from environment variables)
@@ -27,10 +41,63 @@ NO_COLOR = bool(os.getenv("NO_COLOR"))  # Disable ANSI colors.
 NO_EMOJI = bool(os.getenv("NO_EMOJI"))  # Disable emojis in logs.
 NO_TIME = bool(os.getenv("NO_TIME"))  # Disable timestamps.
 LOG_FILE = os.getenv("LOG_FILE")  # Path to log file (Optional).
+LOG_BUFFERED = os.getenv("AUTOML_LOG_BUFFERED", "false").lower() in {
+    "1",
+    "true",
+}  # Batch file writes (and console writes when stdout is not a TTY).
+LOG_ASYNC = os.getenv("AUTOML_LOG_ASYNC", "false").lower() in {
+    "1",
+    "true",
+}  # Write the log file from a background thread.
+
+# Better Windows console handling (colors/emoji); idempotent, so done once at import
+if WINDOWS:
+    try:
+        colorama.just_fix_windows_console()
+    except Exception:
+        pass
+
+# Timestamp format used by PrettyFormatter (no sub-second fields, see its timestamp cache)
+_DATEFMT: Final[str] = "%Y-%m-%d %H:%M:%S"
 
 # Stronger ANSI escape sequence regex (CSI)
 ANSI_RE = re.compile(r"\x1B\[[0-?]*[ -/]*[@-~]")
 
+# ANSI escape codes used by colorstr()
+_COLORS: Final[dict[str, str]] = {
+    "black": "\033[30m",  # basic colors
+    "red": "\033[31m",
+    "green": "\033[32m",
+    "yellow": "\033[33m",
+    "blue": "\033[34m",
+    "magenta": "\033[35m",
+    "cyan": "\033[36m",
+    "white": "\033[37m",
+    "bright_black": "\033[90m",  # bright colors
+    "bright_red": "\033[91m",
+    "bright_green": "\033[92m",
+    "bright_yellow": "\033[93m",
+    "bright_blue": "\033[94m",
+    "bright_magenta": "\033[95m",
+    "bright_cyan": "\033[96m",
+    "bright_white": "\033[97m",
+    "end": "\033[0m",  # misc
+    "bold": "\033[1m",
+    "underline": "\033[4m",
+}
+_PREFIX_BLUE_BOLD: Final[str] = _COLORS["blue"] + _COLORS["bold"]  # colorstr() default
+_SUFFIX_END: Final[str] = _COLORS["end"]
+
+# Codepoints dropped by remove_emoji() (str.translate table, built once)
+_EMOJI_DROP: Final[dict[int, None]] = dict.fromkeys(
+    chain(
+        # Misc Symbols & Pictographs + Supplemental Symbols & Pictographs
+        range(0x1F300, 0x1FB00),
+        range(0x2600, 0x27C0),  # Misc symbols
+        range(0x1F1E6, 0x1F200),  # Flags
+    )
+)
+
 
 def colorstr(*input: str | Path) -> str:
     r"""
@@ -63,29 +130,9 @@ def colorstr(*input: str | Path) -> str:
     References:
         https://en.wikipedia.org/wiki/ANSI_escape_code
     """
-    *args, string = input if len(input) > 1 else ("blue", "bold", input[0])
-    colors = {
-        "black": "\033[30m",  # basic colors
-        "red": "\033[31m",
-        "green": "\033[32m",
-        "yellow": "\033[33m",
-        "blue": "\033[34m",
-        "magenta": "\033[35m",
-        "cyan": "\033[36m",
-        "white": "\033[37m",
-        "bright_black": "\033[90m",  # bright colors
-        "bright_red": "\033[91m",
-        "bright_green": "\033[92m",
-        "bright_yellow": "\033[93m",
-        "bright_blue": "\033[94m",
-        "bright_magenta": "\033[95m",
-        "bright_cyan": "\033[96m",
-        "bright_white": "\033[97m",
-        "end": "\033[0m",  # misc
-        "bold": "\033[1m",
-        "underline": "\033[4m",
-    }
-    return "".join(colors[str(x)] for x in args) + str(string) + colors["end"]
+    if len(input) == 1:
+        return _PREFIX_BLUE_BOLD + str(input[0]) + _SUFFIX_END
+    return "".join([_COLORS[str(x)] for x in input[:-1]]) + str(input[-1]) + _SUFFIX_END
 
 
 def remove_colorstr(input_string: str):
@@ -105,7 +152,7 @@ def remove_colorstr(input_string: str):
 
     Notes:
         - ANSI escape codes typically start with the ESC character (`\x1b`) followed by `[`.
-        - This function removes sequences that match the pattern `\x1b[[0-9;]*[A-Za-z]`.
+        - This function removes CSI sequences matched by the module-level `ANSI_RE` pattern.
 
     Examples:
         >>> remove_colorstr(colorstr("blue", "bold", "hello world"))
@@ -116,8 +163,9 @@ def remove_colorstr(input_string: str):
     References:
         https://en.wikipedia.org/wiki/ANSI_escape_code
     """
-    ansi_escape = re.compile(r"\x1B\[[0-9;]*[A-Za-z]")
-    return ansi_escape.sub("", input_string)
+    if "\x1b" not in input_string:  # fast path: nothing to strip
+        return input_string
+    return ANSI_RE.sub("", input_string)
 
 
 def remove_emoji(input_string: str) -> str:
@@ -150,34 +198,39 @@ def remove_emoji(input_string: str) -> str:
         https://en.wikipedia.org/wiki/Unicode_block#Emoticons
         https://unicode.org/emoji/charts/full-emoji-list.html
     """
-    emoji_pattern = re.compile(
-        r"[\U0001F300-\U0001FAFF"  # Misc Symbols & Pictographs + Supplemental Symbols & Pictographs
-        r"\U00002600-\U000027BF"  # Misc symbols
-        r"\U0001F1E6-\U0001F1FF]+",  # Flags
-        flags=re.UNICODE,
-    )
-    return emoji_pattern.sub("", input_string)
+    if input_string.isascii():  # fast path: all covered ranges are >= U+2600
+        return input_string
+    return input_string.translate(_EMOJI_DROP)
+
+
+# Level emojis and their plain-text fallbacks for terminals that cannot render them
+# (each emoji is a single codepoint, so one str.translate pass replaces all of them)
+_EMOJI_FALLBACK: Final[dict[int, str]] = {
+    ord("🐛"): "DEBUG",
+    ord("📘"): "INFO",
+    ord("🎉"): "SUCCESS",
+    ord("🚧"): "WARNING",
+    ord("🐞"): "ERROR",
+    ord("💀"): "CRITICAL",
+}
+
 
+def _emojis_passthrough(s: str) -> str:
+    """Return `s` unchanged; used when stdout can render emojis."""
+    return s
 
-def _emojis(s: str) -> str:
+
+def _emojis_replace(s: str) -> str:
     """
     Replace emojis when the terminal encoding cannot render them.
     Mappings:
       🐛 -> DEBUG, 📘 -> INFO, 🎉 -> SUCCESS, 🚧 -> WARNING, 🐞 -> ERROR, 💀 -> CRITICAL
     """
-    try:
-        s.encode(sys.stdout.encoding or "utf-8", errors="strict")
-        return s
-    except Exception:
-        # Remove common emojis in the example.
-        return (
-            s.replace("🐛", "DEBUG")
-            .replace("📘", "INFO")
-            .replace("🎉", "SUCCESS")
-            .replace("🚧", "WARNING")
-            .replace("🐞", "ERROR")
-            .replace("💀", "CRITICAL")
-        )
+    return s.translate(_EMOJI_FALLBACK)
+
+
+# Resolved once at import instead of trial-encoding every formatted record
+_emojis = _emojis_passthrough if _STDOUT_UTF8 else _emojis_replace
 
 
 class PrettyFormatter(logging.Formatter):
@@ -230,11 +283,15 @@ class PrettyFormatter(logging.Formatter):
         2025-10-06 14:32:15 INFO 📘 Application started
 
     Notes:
-        - When `use_color=False`, all ANSI escape codes are stripped via `remove_colorstr()`.
-        - When `use_emoji=False`, emojis are removed via `remove_emoji()`.
+        - When `use_color=False`, ANSI escape codes in the message are stripped via
+          `remove_colorstr()`; the formatter itself emits none.
+        - When `use_emoji=False`, emojis in the message are removed via `remove_emoji()`;
+          the formatter itself emits none.
         - The `_emojis()` helper ensures compatibility with terminals that cannot render emojis.
         - File handlers should typically set both `use_color=False` and `use_emoji=False`
           to keep log files plain-text friendly.
+        - The per-level line templates are specialized for `use_color`, `use_emoji` and
+          `show_time`; assigning any of them rebuilds the templates.
 
     References:
         https://docs.python.org/3/library/logging.html#logging.Formatter
@@ -259,55 +316,352 @@ class PrettyFormatter(logging.Formatter):
         **kwargs,
     ):
         # don't use fmt with asctime to control its position ourselves
-        super().__init__("%(message)s", datefmt="%Y-%m-%d %H:%M:%S")
-        self.use_color = use_color
-        self.use_emoji = use_emoji
-        self.show_time = show_time
+        super().__init__("%(message)s", datefmt=_DATEFMT)
+        # backing fields for the properties below, which rebuild the templates on set
+        self._use_color = use_color
+        self._use_emoji = use_emoji
+        self._show_time = show_time
+        # (second, formatted timestamp); datefmt has no sub-second fields
+        self._ts_cache: tuple[int, str] = (-1, "")
+        self._build_templates()
 
         if kwargs:
             warnings.warn(
                 f"Ignored unknown kwarg(s): {list(kwargs)}", UserWarning, stacklevel=2
             )
 
-    def format(self, record: logging.LogRecord) -> str:
-        msg = super().format(record)
-        # show exception text if present
-        if record.exc_info:
-            try:
-                msg = f"{msg}\n{self.formatException(record.exc_info)}"
-            except Exception:
-                pass
-
-        label, color, emoji = self.LEVEL_STYLE.get(
-            record.levelno, (record.levelname, None, "")
-        )
+    @property
+    def use_color(self) -> bool:
+        """Whether ANSI color codes are emitted."""
+        return self._use_color
+
+    @use_color.setter
+    def use_color(self, value: bool) -> None:
+        self._use_color = value
+        self._build_templates()
+
+    @property
+    def use_emoji(self) -> bool:
+        """Whether level emojis are emitted."""
+        return self._use_emoji
+
+    @use_emoji.setter
+    def use_emoji(self, value: bool) -> None:
+        self._use_emoji = value
+        self._build_templates()
+
+    @property
+    def show_time(self) -> bool:
+        """Whether each line starts with a timestamp."""
+        return self._show_time
+
+    @show_time.setter
+    def show_time(self, value: bool) -> None:
+        self._show_time = value
+        self._build_templates()
+
+    def _build_templates(self) -> None:
+        """
+        Specialize the per-level line templates for the current flags.
+
+        Each level maps to `(prefix, middle)` with `out = prefix + timestamp + middle + msg`,
+        so `format()` only concatenates. A list indexed by levelno is cheaper per record
+        than a dict lookup.
+        """
+        ts_sep = " " if self._show_time else ""
+        level_fmt: list[tuple[str, str] | None] = [None] * (max(self.LEVEL_STYLE) + 1)
+        for lvl, (label, color, emoji) in self.LEVEL_STYLE.items():
+            ts_prefix, ts_suffix = (
+                (_COLORS[color] + _COLORS["bold"], _COLORS["end"])
+                if (self._use_color and color and self._show_time)
+                else ("", "")
+            )
+            level_tag = self._build_tag(label, color, emoji)
+            level_fmt[lvl] = (ts_prefix, f"{ts_suffix}{ts_sep}{level_tag} ")
+        self._ts_sep = ts_sep
+        self._level_fmt = level_fmt
 
+    def _build_tag(self, label: str, color: str | None, emoji: str) -> str:
+        """Build the (optionally colored and emoji-suffixed) level tag for one level."""
         level_tag = label
         if self.use_color and color:
             level_tag = colorstr("bold", color, label)
         if self.use_emoji and emoji:
             level_tag = f"{level_tag} {emoji}"
+        return level_tag
 
-        parts = []
-        if self.show_time:
-            ts_txt = self.formatTime(record, self.datefmt)
-            parts.append(
-                colorstr(color, "bold", ts_txt)
-                if (self.use_color and color)
-                else ts_txt
-            )
-        parts.append(level_tag)
-        parts.append(msg)
+    def format(self, record: logging.LogRecord) -> str:
+        # Build the message directly instead of super().format(), which would run
+        # the "%(message)s" style pass and append the traceback a second time.
+        record.message = msg = record.getMessage()
+        # show exception text if present; cached on the record like logging.Formatter
+        # does, so the traceback is only rendered once for all handlers
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            msg = f"{msg}\n{record.exc_text}"
+        if record.stack_info:
+            msg = f"{msg}\n{self.formatStack(record.stack_info)}"
+
+        # The formatter never emits ANSI codes/emojis itself when the matching flag is
+        # off, so only the user-provided message (and traceback) needs stripping.
+        # Same fast paths as remove_colorstr()/remove_emoji(), inlined to skip the calls.
+        if not self._use_color and "\x1b" in msg:
+            msg = ANSI_RE.sub("", msg)  # Delete ANSI color
+        # Remove all emoji characters (covering most common Unicode emoji ranges)
+        if not self._use_emoji and not msg.isascii():
+            msg = msg.translate(_EMOJI_DROP)
+
+        lvl = record.levelno
+        style = self._level_fmt[lvl] if 0 <= lvl < len(self._level_fmt) else None
+        prefix, middle = style or ("", f"{self._ts_sep}{record.levelname} ")
+
+        ts_txt = ""
+        if self._show_time:
+            sec = int(record.created)
+            # read the shared cache once; another handler's thread may replace it
+            cached_sec, ts_txt = self._ts_cache
+            if sec != cached_sec:
+                ts_txt = time.strftime(_DATEFMT, self.converter(sec))
+                self._ts_cache = (sec, ts_txt)
+        # an empty message adds no trailing separator
+        out = prefix + ts_txt + (middle + msg if msg else middle.rstrip(" "))
+        return _emojis(out)
 
-        out = " ".join(p for p in parts if p)
 
-        if not self.use_color:
-            out = remove_colorstr(out)  # Delete ANSI color
+# Shared formatters used by set_logging() (private): every logger reuses the same
+# precomputed level tables instead of building new formatters per call. Changing
+# their flags would restyle every logger, so set a new PrettyFormatter on a handler
+# to change its style.
+_CONSOLE_FMT = PrettyFormatter(
+    use_color=not NO_COLOR,
+    use_emoji=not NO_EMOJI,
+    show_time=not NO_TIME,
+)
+_FILE_FMT = PrettyFormatter(use_color=False, use_emoji=False, show_time=not NO_TIME)
 
-        # Remove all emoji characters (covering most common Unicode emoji ranges)
-        if not self.use_emoji:
-            out = remove_emoji(out)
-        return _emojis(out)
+
+# Live BufferedStreamHandler/BufferedFileHandler instances, flushed before os.fork()
+_BUFFERED_HANDLERS: weakref.WeakSet = weakref.WeakSet()
+# Live AsyncFileHandler instances, whose writer threads are paused around os.fork()
+_ASYNC_HANDLERS: weakref.WeakSet = weakref.WeakSet()
+
+
+class BufferedStreamHandler(logging.StreamHandler):
+    """
+    A `StreamHandler` that only flushes the stream for records at or above `flush_level`.
+
+    `logging.StreamHandler` flushes after every record, which costs one `write(2)` per
+    log line. This handler leaves lower-level records in the stream's buffer so writes
+    are batched, while warnings and errors still reach the stream immediately.
+
+    Args:
+        stream (IO[str] | None, optional): The stream to write to. Defaults to `sys.stderr`.
+        flush_level (int, optional): Minimum level that triggers a flush.
+            Defaults to `logging.WARNING`.
+
+    Notes:
+        - Buffered records are written out by `flush()`/`close()`, which `logging.shutdown()`
+          calls for every handler at interpreter exit.
+        - On `os.fork()` the buffer is flushed first, so the child does not inherit and
+          re-write it, and the child's handler flushes every record because forked
+          workers usually exit via `os._exit()` without running `logging.shutdown()`.
+    """
+
+    def __init__(self, stream=None, flush_level: int = logging.WARNING):
+        super().__init__(stream)
+        self.flush_level = flush_level
+        _BUFFERED_HANDLERS.add(self)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            msg = self.format(record)
+            self.stream.write(msg + self.terminator)
+            if record.levelno >= self.flush_level:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class BufferedFileHandler(logging.FileHandler, BufferedStreamHandler):
+    """
+    A `FileHandler` that writes through a large buffer and flushes like `BufferedStreamHandler`.
+
+    Args:
+        filename (str | os.PathLike): Path of the log file.
+        mode (str, optional): File open mode. Defaults to `"a"`.
+        encoding (str | None, optional): Text encoding of the file. Defaults to None.
+        delay (bool, optional): Defer opening the file until the first record. Defaults to False.
+        errors (str | None, optional): Encoding error handling scheme. Defaults to None.
+        buffer_size (int, optional): Size in bytes of the file buffer. Defaults to 64 KiB.
+        flush_level (int, optional): Minimum level that triggers a flush.
+            Defaults to `logging.WARNING`.
+    """
+
+    def __init__(
+        self,
+        filename,
+        mode: str = "a",
+        encoding: str | None = None,
+        delay: bool = False,
+        errors: str | None = None,
+        *,
+        buffer_size: int = 64 * 1024,
+        flush_level: int = logging.WARNING,
+    ):
+        # set before FileHandler.__init__, which may call _open()
+        self.buffer_size = buffer_size
+        self.flush_level = flush_level
+        super().__init__(filename, mode, encoding, delay, errors)
+        _BUFFERED_HANDLERS.add(self)
+
+    def _open(self):
+        return self._builtin_open(
+            self.baseFilename,
+            self.mode,
+            buffering=self.buffer_size,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # same lazy-open logic as FileHandler.emit(), then the deferred-flush write
+        if self.stream is None:
+            if self.mode != "w" or not self._closed:
+                self.stream = self._open()
+        if self.stream:
+            BufferedStreamHandler.emit(self, record)
+
+
+class _FlushingQueueListener(logging.handlers.QueueListener):
+    """A `QueueListener` that sets `threading.Event` markers it dequeues, for `flush()`."""
+
+    def __init__(self, queue, *handlers):
+        super().__init__(queue, *handlers)
+        # held while handling each record; os.fork() takes it to pause between records
+        self.fork_lock = threading.Lock()
+
+    def handle(self, record) -> None:
+        with self.fork_lock:
+            if isinstance(record, threading.Event):
+                record.set()  # every record queued before the marker has been handled
+                return
+            super().handle(record)
+
+
+class AsyncFileHandler(logging.handlers.QueueHandler):
+    """
+    A file handler that hands records to a background thread which performs the disk writes.
+
+    Records are formatted with this handler's formatter in the calling thread, queued,
+    and written by a `QueueListener` thread into a `BufferedFileHandler`, so application
+    threads never block on `write(2)`.
+
+    Args:
+        filename (str | os.PathLike): Path of the log file.
+        encoding (str | None, optional): Text encoding of the file. Defaults to None.
+
+    Attributes:
+        baseFilename (str): Absolute path of the log file, as on `logging.FileHandler`.
+
+    Notes:
+        - `flush()` waits until the records queued before the call have been written, then
+          flushes the file; records queued concurrently by other threads are not waited for.
+        - `close()` drains the queue and stops the writer thread; `logging.shutdown()`
+          calls it at interpreter exit.
+        - The writer thread does not survive `os.fork()`: it is paused between records
+          around the fork, and in the child this handler writes synchronously; records
+          still queued at the fork are written by the parent only.
+    """
+
+    def __init__(self, filename, encoding: str | None = None):
+        # create the file handler first so logging.shutdown() closes it after this one
+        self._file_handler = BufferedFileHandler(filename, encoding=encoding)
+        self.baseFilename = self._file_handler.baseFilename
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        super().__init__(log_queue)
+        self._listener: _FlushingQueueListener | None = _FlushingQueueListener(
+            log_queue, self._file_handler
+        )
+        self._listener.start()
+        _ASYNC_HANDLERS.add(self)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if self._listener is not None:
+            super().emit(record)
+            return
+        # no writer thread (forked child or closed handler): write synchronously
+        try:
+            self._file_handler.handle(self.prepare(record))
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        if self._listener is not None:
+            # wait for a marker rather than queue emptiness, which other threads may
+            # keep from ever happening
+            done = threading.Event()
+            self.queue.put_nowait(done)
+            done.wait()
+        self._file_handler.flush()
+
+    def close(self) -> None:
+        try:
+            if self._listener is not None:
+                self._listener.stop()
+                self._listener = None
+            self._file_handler.close()
+        finally:
+            super().close()
+
+    def _pause_for_fork(self) -> None:
+        # wait for at most the record being written, not for the whole backlog
+        if self._listener is not None:
+            self._listener.fork_lock.acquire()
+        self._file_handler.flush()
+
+    def _resume_after_fork(self) -> None:
+        if self._listener is not None:
+            self._listener.fork_lock.release()
+
+
+def _before_fork() -> None:
+    """Pause async writer threads and flush buffered handlers so a child inherits nothing pending."""
+    for ah in list(_ASYNC_HANDLERS):
+        try:
+            ah._pause_for_fork()
+        except Exception:
+            pass
+    for bh in list(_BUFFERED_HANDLERS):
+        try:
+            bh.flush()
+        except Exception:
+            pass
+
+
+def _after_fork_in_parent() -> None:
+    """Let the async writer threads paused by `_before_fork()` continue."""
+    for ah in list(_ASYNC_HANDLERS):
+        ah._resume_after_fork()
+
+
+def _after_fork_in_child() -> None:
+    """Switch handlers in a forked child to write (and flush) every record directly."""
+    for ah in list(_ASYNC_HANDLERS):
+        ah._resume_after_fork()
+        ah._listener = None  # the writer thread only exists in the parent
+    for bh in list(_BUFFERED_HANDLERS):
+        bh.flush_level = logging.NOTSET
+
+
+if hasattr(os, "register_at_fork"):  # POSIX only
+    os.register_at_fork(
+        before=_before_fork,
+        after_in_parent=_after_fork_in_parent,
+        after_in_child=_after_fork_in_child,
+    )
 
 
 def _register_success_level() -> None:
@@ -321,6 +675,30 @@ def _register_success_level() -> None:
     logging.Logger.success = success  # type: ignore[attr-defined]
 
 
+def _find_handlers(
+    logger: logging.Logger, target: str | None = None
+) -> tuple[list[logging.StreamHandler], logging.Handler | None]:
+    """
+    Find the stdout handlers and the handler writing to `target` on `logger` in one pass.
+
+    `target` is the log file's absolute path (resolved once by the caller) and is compared
+    against each file handler's `baseFilename`.
+
+    Returns:
+        (tuple[list[logging.StreamHandler], logging.Handler | None]): Every stdout handler
+            (empty when none is attached) and the file handler for `target` (or None).
+    """
+    stdout_hs: list[logging.StreamHandler] = []
+    file_h = None
+    for h in logger.handlers:
+        if isinstance(h, (logging.FileHandler, AsyncFileHandler)):
+            if target and h.baseFilename == target:
+                file_h = h
+        elif isinstance(h, logging.StreamHandler) and h.stream is sys.stdout:
+            stdout_hs.append(h)
+    return stdout_hs, file_h
+
+
 def set_logging(
     name: str = "logger",
     verbose: bool = True,
@@ -349,16 +727,25 @@ def set_logging(
 
     Notes:
         - The custom `SUCCESS` level (25) is added via `_register_success_level()`.
-        - On Windows systems, `colorama.just_fix_windows_console()` is called to enable
-          proper color rendering in terminals.
+        - On Windows systems, `colorama.just_fix_windows_console()` is called once at module
+          import to enable proper color rendering in terminals.
         - If the same logger name is reused, this function updates existing handlers
-          rather than adding duplicates.
+          rather than adding duplicates; calls with unchanged settings return early while
+          the logger and its handlers are still configured as this function left them.
+        - All loggers configured here share one console and one file `PrettyFormatter`;
+          to restyle a single handler, give it its own `PrettyFormatter` rather than
+          changing the shared formatter's flags.
         - The file handler (if created) always writes logs in UTF-8 and excludes ANSI codes
-          or emojis for clean text files.
+          or emojis for clean text files. With `AUTOML_LOG_BUFFERED` set it is a
+          `BufferedFileHandler`, so records below `WARNING` are flushed in batches rather
+          than one write per line. With `AUTOML_LOG_ASYNC` set, an `AsyncFileHandler`
+          writes the file from a background thread.
         - Console formatting behavior respects the environment variables:
             - `NO_COLOR`: disables colors.
             - `NO_EMOJI`: disables emojis.
             - `NO_TIME`: hides timestamps.
+            - `AUTOML_LOG_BUFFERED`: buffer the log file and, when stdout is not a TTY,
+              use a `BufferedStreamHandler` instead of flushing every line.
 
     Examples:
         >>> logger = set_logging("myapp", verbose=True, log_file="app.log")
@@ -379,59 +766,55 @@ def set_logging(
     level = logging.DEBUG if verbose else logging.INFO
     _register_success_level()
 
-    # Better Windows console handling (colors/emoji)
-    try:
-        if WINDOWS:
-            colorama.just_fix_windows_console()
-    except Exception:
-        pass
-
     logger = logging.getLogger(name)
+    target = os.path.abspath(log_file) if log_file else None
+    stdout_hs, file_h = _find_handlers(logger, target)
+
+    # Already configured with the same settings, and nothing has changed it since:
+    # same logger level/propagation, stdout handlers still set up as below, and the
+    # requested file handler still attached
+    config = (level, target)
+    if (
+        getattr(logger, "_automl_configured", None) == config
+        and logger.level == level
+        and not logger.propagate
+        and stdout_hs
+        and all(h.level == level and h.formatter is _CONSOLE_FMT for h in stdout_hs)
+        and (file_h is not None or not log_file)
+    ):
+        return logger
+
     logger.setLevel(level)
     logger.propagate = False
 
     # ---- Console handler ----
-    console_fmt = PrettyFormatter(
-        use_color=not NO_COLOR,
-        use_emoji=not NO_EMOJI,
-        show_time=not NO_TIME,
-    )
-
-    if not any(
-        isinstance(h, logging.StreamHandler)
-        and getattr(h, "stream", None) is sys.stdout
-        for h in logger.handlers
-    ):
-        ch = logging.StreamHandler(sys.stdout)
+    if not stdout_hs:
+        ch: logging.StreamHandler
+        if LOG_BUFFERED and not getattr(sys.stdout, "isatty", lambda: False)():
+            ch = BufferedStreamHandler(sys.stdout)
+        else:
+            ch = logging.StreamHandler(sys.stdout)  # flush per line for interactivity
         ch.setLevel(level)
-        ch.setFormatter(console_fmt)
+        ch.setFormatter(_CONSOLE_FMT)
         logger.addHandler(ch)
-    else:
-        for h in logger.handlers:
-            if (
-                isinstance(h, logging.StreamHandler)
-                and getattr(h, "stream", None) is sys.stdout
-            ):
-                h.setLevel(level)
-                h.setFormatter(console_fmt)
+    for h in stdout_hs:
+        h.setLevel(level)
+        h.setFormatter(_CONSOLE_FMT)
 
     # ---- File handler (always no color/emoji) ----
-    if log_file and not any(
-        isinstance(h, logging.FileHandler)
-        and getattr(h, "baseFilename", None) == os.path.abspath(log_file)
-        for h in logger.handlers
-    ):
-        fh = logging.FileHandler(log_file, encoding="utf-8")
+    if log_file and file_h is None:
+        fh: logging.Handler
+        if LOG_ASYNC:
+            fh = AsyncFileHandler(log_file, encoding="utf-8")
+        elif LOG_BUFFERED:
+            fh = BufferedFileHandler(log_file, encoding="utf-8")
+        else:
+            fh = logging.FileHandler(log_file, encoding="utf-8")
         fh.setLevel(level)
-        fh.setFormatter(
-            PrettyFormatter(
-                use_color=False,
-                use_emoji=False,
-                show_time=not NO_TIME,
-            )
-        )
+        fh.setFormatter(_FILE_FMT)
         logger.addHandler(fh)
 
+    logger._automl_configured = config  # type: ignore[attr-defined]
     return logger
 
 
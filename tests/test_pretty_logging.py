@@ -0,0 +1,83 @@
+import faulthandler
+import logging
+import os
+import threading
+import time
+
+import pytest
+
+from automl.utils.pretty_logging import AsyncFileHandler, PrettyFormatter
+
+requires_fork = pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork()")
+
+
+@pytest.fixture
+def async_logger(tmp_path):
+    """Logger with an AsyncFileHandler and four threads logging DEBUG in a loop."""
+    log_path = tmp_path / "async.log"
+    handler = AsyncFileHandler(log_path, encoding="utf-8")
+    logger = logging.getLogger(f"test_async_{id(handler)}")
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    logger.addHandler(handler)
+    # make the writer thread slower than the producers so the queue never drains
+    handler._file_handler.addFilter(lambda record: time.sleep(0.001) or True)
+
+    stop = threading.Event()
+
+    def spam():
+        while not stop.is_set():
+            logger.debug("background record")
+            time.sleep(0.001)
+
+    threads = [threading.Thread(target=spam, daemon=True) for _ in range(4)]
+    for t in threads:
+        t.start()
+    time.sleep(0.1)  # let the queue build up a backlog
+
+    # abort with a traceback instead of hanging forever if flush()/fork blocks on the
+    # busy queue (an exception could not escape os.fork()'s before-fork hooks)
+    faulthandler.dump_traceback_later(30, exit=True)
+    try:
+        yield logger, handler, log_path
+    finally:
+        faulthandler.cancel_dump_traceback_later()
+        stop.set()
+        for t in threads:
+            t.join()
+        logger.removeHandler(handler)
+        handler.close()
+
+
+@requires_fork
+def test_flush_returns_while_other_threads_log(async_logger):
+    logger, handler, log_path = async_logger
+    logger.info("before flush")
+    handler.flush()
+    assert "before flush" in log_path.read_text(encoding="utf-8")
+
+
+@requires_fork
+@pytest.mark.filterwarnings("ignore::DeprecationWarning")  # fork() with live threads
+def test_fork_while_other_threads_log(async_logger):
+    logger, handler, log_path = async_logger
+    pid = os.fork()
+    if pid == 0:  # child: no writer thread, must write synchronously
+        logger.warning("child record")
+        os._exit(0)
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
+
+    logger.info("parent after fork")
+    handler.flush()
+    text = log_path.read_text(encoding="utf-8")
+    assert text.count("child record") == 1
+    assert text.count("parent after fork") == 1
+
+
+@pytest.mark.parametrize("flag", ["use_color", "use_emoji", "show_time"])
+def test_setting_flags_matches_a_fresh_formatter(flag):
+    record = logging.LogRecord("x", logging.INFO, __file__, 1, "msg", (), None)
+    fmt = PrettyFormatter()
+    setattr(fmt, flag, False)
+    assert fmt.format(record) == PrettyFormatter(**{flag: False}).format(record)